@@ -1,6 +1,34 @@
 #!python3
 
+import sys
+
 import cvxpy
+import numpy as np
+
+# Cache of parametrized problems, keyed by matrix shape. With the utility
+# matrix as a cvxpy.Parameter the problem is DPP-compliant, so repeated calls
+# with the same shape reuse the canonicalized form instead of re-parsing it.
+_problem_cache = {}
+
+def _egalitarian_problem(n, m):
+    try:
+        return _problem_cache[(n, m)]
+    except KeyError:
+        M = cvxpy.Parameter((n, m))
+
+        # X[i, j] = fraction of resource j given to agent i
+        X = cvxpy.Variable((n, m), nonneg=True)
+
+        # utilities[i] = sum_j mat[i][j] * X[i, j], as a single vector expression
+        utilities = cvxpy.sum(cvxpy.multiply(M, X), axis=1)
+
+        min_utility = cvxpy.Variable()
+        prob = cvxpy.Problem(
+            cvxpy.Maximize(min_utility),
+            [cvxpy.sum(X, axis=0) == 1, X <= 1, min_utility <= utilities])
+
+        _problem_cache[(n, m)] = (prob, M, X)
+        return prob, M, X
 
 def find_print_eglatarian_division(mat):
     """
@@ -15,34 +43,21 @@ def find_print_eglatarian_division(mat):
     m = len(mat[0]) # number of resources
     n = len(mat)    # number of people
 
-    resources = []
-    
-    for j in range(m):
-        resources.append(cvxpy.Variable(n))
-
-    utilities = []
-    for i in range(n):
-        utility = 0
-        for j in range(m):
-            utility += mat[i][j] * resources[j][i]
-        utilities.append(utility)
-
-    constraints = []
-    for j in range(m):
-        constraints.append(0 <= resources[j])
-        constraints.append(resources[j] <= 1)
-        constraints.append(cvxpy.sum(resources[j]) == 1)
-
-    min_utility = cvxpy.Variable()
-    prob = cvxpy.Problem(
-        cvxpy.Maximize(min_utility),
-        constraints = constraints + [min_utility <= utilities[i] for i in range(n)])
-    prob.solve()
-
-    for i in range(n):
-        print(f"Agent #{i+1} gets: ", end="")
-        for j in range(m):
-            print(f"{resources[j][i].value:.2f} of resource #{j+1}", end=", " if j < m-1 else ".\n")
+    prob, M, X = _egalitarian_problem(n, m)
+    M.value = np.asarray(mat, dtype=float)
+    # Pick the conic solver explicitly: for a tiny LP like this the default
+    # solver selection is slower than going straight to CLARABEL.
+    prob.solve(solver=cvxpy.CLARABEL, verbose=False, enforce_dpp=True)
+
+    # Assemble the whole report and write it in one go rather than one
+    # print call (and stdout lock) per cell
+    lines = [
+        f"Agent #{i+1} gets: "
+        + ", ".join(f"{X.value[i, j]:.2f} of resource #{j+1}" for j in range(m))
+        + "."
+        for i in range(n)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     mat = [
@@ -1,7 +1,5 @@
 import numpy as np
 from scipy.optimize import linear_sum_assignment
-from scipy.sparse.csgraph import maximum_bipartite_matching
-from scipy.sparse import csr_matrix
 
 def max_product_assignment(mat, forbid_zero=True, eps=1e-12):
     """
@@ -46,25 +44,21 @@ def max_product_assignment(mat, forbid_zero=True, eps=1e-12):
     if np.any(U < 0):
         raise ValueError("Matrix contains negative utilities. This function expects non-negative utilities.")
 
-    # Replace zeros according to forbid_zero flag
+    # Replace zeros according to forbid_zero flag.
+    # Fused into a single expression (no U.copy() / mask passes): clamp to eps
+    # so the log is always defined, then overwrite the zero entries in one go.
     if forbid_zero:
-        tiny = eps
-        U_safe = U.copy()
-        zero_mask = (U_safe <= 0)
-        U_safe[zero_mask] = tiny
-        cost = -np.log(U_safe)
-        cost[zero_mask] = 1e9
+        cost = np.where(U > 0, -np.log(np.maximum(U, eps)), 1e9)
     else:
-        U_safe = U.copy()
-        U_safe[U_safe <= 0] = eps
-        cost = -np.log(U_safe)
+        cost = -np.log(np.maximum(U, eps))
 
     # linear_sum_assignment minimizes the total cost
     row_ind, col_ind = linear_sum_assignment(cost)
 
-    chosen_values = U[row_ind, col_ind]
-    total_logsum = np.sum(np.log(np.maximum(chosen_values, eps)))
-    total_product = float(np.prod(chosen_values))
+    # The logs were already computed for the cost matrix; read them back
+    # instead of re-running np.log over the chosen entries.
+    total_logsum = float(np.sum(-cost[row_ind, col_ind]))
+    total_product = float(np.exp(total_logsum))
 
     assignment = list(zip(row_ind.tolist(), col_ind.tolist()))
     return assignment, total_product, total_logsum
@@ -82,8 +76,9 @@ def find_print_etlatarian_division(mat):
     Agent #2 gets resource #1 (utility: 3)
     Total utility: 5
     """
-    cost_matrix = -np.array(mat)
-    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    # maximize=True avoids the negate-and-copy; integer input stays integer,
+    # which hits the faster integer path in scipy's LSAP solver
+    row_ind, col_ind = linear_sum_assignment(np.asarray(mat), maximize=True)
     
     total_utility = 0
     for i, j in zip(row_ind, col_ind):
@@ -111,28 +106,50 @@ def egalitarian_assignment(mat, tol=1e-6):
     >>> sorted(assignment)
     [(0, 1), (1, 0)]
     """
-    mat = np.array(mat, dtype=float)
+    mat = np.asarray(mat, dtype=float)
     n = mat.shape[0]
-
-    unique_values = np.unique(mat)
-    lo, hi = 0, len(unique_values) - 1
-    best_threshold = unique_values[0]
+    flat = mat.ravel()
+
+    # Sweep edges once in descending weight order, growing an incremental
+    # bipartite matching; the weight at which the matching first becomes
+    # perfect is exactly the egalitarian threshold. This replaces the
+    # binary search that re-ran a full matching per candidate threshold.
+    order = np.argsort(-flat, kind="stable")
+
+    adjacency = [[] for _ in range(n)]  # columns opened so far, per row
+    match_row = [-1] * n                # row -> matched column
+    match_col = [-1] * n                # column -> matched row
+
+    def try_augment(row, visited):
+        for col in adjacency[row]:
+            if not visited[col]:
+                visited[col] = True
+                if match_col[col] == -1 or try_augment(match_col[col], visited):
+                    match_row[row] = col
+                    match_col[col] = row
+                    return True
+        return False
+
+    best_threshold = float(flat[order[-1]])
     best_assignment = None
-
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        threshold = unique_values[mid]
-
-        adjacency = (mat >= threshold).astype(int)
-        graph = csr_matrix(adjacency)
-
-        match = maximum_bipartite_matching(graph, perm_type='column')
-        if np.all(match != -1):  # perfect matching found
-            best_threshold = threshold
-            best_assignment = list(enumerate(match.tolist()))
-            lo = mid + 1
-        else:
-            hi = mid - 1
+    matched = 0
+    idx = 0
+    while idx < n * n and matched < n:
+        threshold = flat[order[idx]]
+        # Open every edge tied at this weight before re-matching
+        while idx < n * n and flat[order[idx]] == threshold:
+            i, j = divmod(int(order[idx]), n)
+            adjacency[i].append(j)
+            idx += 1
+        # One augmenting-path pass over the unmatched rows keeps the
+        # matching maximum after the new edges are added.
+        for i in range(n):
+            if match_row[i] == -1:
+                if try_augment(i, [False] * n):
+                    matched += 1
+        if matched == n:
+            best_threshold = float(threshold)
+            best_assignment = list(enumerate(match_row))
 
     return best_threshold, best_assignment
 
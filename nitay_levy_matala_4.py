@@ -1,5 +1,5 @@
-import math
 from typing import List
+import numpy as np
 from scipy.optimize import linear_sum_assignment
 
 
@@ -61,64 +61,74 @@ def envy_free_room_allocation(valuations: List[List[float]], rent: float, verbos
     n = len(valuations)
 
     # -----------------------------
-    # STEP 1 — Welfare-maximizing assignment via Hungarian algorithm
+    # STEP 0 — Closed forms for the trivial sizes, skipping scipy entirely
     # -----------------------------
-    # Hungarian solves a *minimization* problem, so negate valuations.
-    cost = [[-v for v in row] for row in valuations]
-    players, rooms = linear_sum_assignment(cost)
-
-    # assignment[i] = room assigned to player i
-    assignment = {p: r for p, r in zip(players, rooms)}
-
-    # -----------------------------
-    # STEP 2 — Compute envy-free prices using potentials via Bellman–Ford
-    # -----------------------------
-    # Build directed graph on players:
-    # edge i → j has weight:
-    #    w(i→j) = v(i, room_i) – v(i, room_j)
-    #
-    # The "potential" for player i is the max path weight leaving i.
-
-    # Build edge list
-    edges = []
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                continue
-            ri = assignment[i]
-            rj = assignment[j]
-            w = valuations[i][ri] - valuations[i][rj]
-            edges.append((i, j, w))
-
-    # Bellman–Ford: compute longest-path potentials
-    # (negate weights since BF normally computes MIN distance)
-    def longest_paths_from(src):
-        dist = [-math.inf] * n
-        dist[src] = 0
-
-        # Relax edges n−1 times
-        for _ in range(n - 1):
-            improved = False
-            for u, v, w in edges:
-                if dist[u] != -math.inf and dist[u] + w > dist[v]:
-                    dist[v] = dist[u] + w
-                    improved = True
-            if not improved:
-                break
-        return dist
-
-    potentials = [max(longest_paths_from(i)) for i in range(n)]
-
-    # Convert potentials into preliminary prices (they are envy-free)
-    # Payment_i = potential_i
-    prices = potentials[:]
-
-    # -----------------------------
-    # Adjust prices so they sum to the rent
-    # -----------------------------
-    total_price = sum(prices)
-    shift = (total_price - rent) / n
-    prices = [p - shift for p in prices]
+    if n == 1:
+        # One player takes the only room and pays the full rent
+        assignment = {0: 0}
+        prices = [float(rent)]
+    elif n == 2:
+        # Pick the welfare-maximizing assignment directly, then set the price
+        # gap midway between the two players' premiums for the chosen rooms;
+        # the welfare-maximizing choice guarantees that midpoint is envy-free.
+        if valuations[0][0] + valuations[1][1] >= valuations[0][1] + valuations[1][0]:
+            assignment = {0: 0, 1: 1}
+        else:
+            assignment = {0: 1, 1: 0}
+        r0, r1 = assignment[0], assignment[1]
+        gap = (valuations[0][r0] - valuations[0][r1]
+               + valuations[1][r0] - valuations[1][r1]) / 2.0
+        prices = [rent / 2.0 + gap / 2.0, rent / 2.0 - gap / 2.0]
+    else:
+        # -----------------------------
+        # STEP 1 — Welfare-maximizing assignment via Hungarian algorithm
+        # -----------------------------
+        # Hand scipy a contiguous ndarray so it skips the list-of-lists
+        # conversion; maximize=True avoids negating the matrix, and integer
+        # valuations stay on scipy's integer fast path.
+        V = np.asarray(valuations)
+        players, rooms = linear_sum_assignment(V, maximize=True)
+
+        # assignment[i] = room assigned to player i (built-in ints, not numpy scalars)
+        assignment = {int(p): int(r) for p, r in zip(players, rooms)}
+
+        # -----------------------------
+        # STEP 2 — Compute envy-free prices using potentials via Bellman–Ford
+        # -----------------------------
+        # Build directed graph on players:
+        # edge i → j has weight:
+        #    w(i→j) = v(i, room_i) – v(i, room_j)
+        #
+        # The "potential" for player i is the max path weight leaving i.
+
+        # Build the weight matrix W[i, j] = w(i→j) with fancy indexing:
+        # column j holds each player's valuation of player j's room.
+        assigned_rooms = rooms  # room of player i, in player order
+        own_values = V[np.arange(n), assigned_rooms]
+        W = own_values[:, None] - V[:, assigned_rooms]
+
+        # Floyd–Warshall, vectorized: the graph is small and dense, so one
+        # Python loop of n vectorized relaxations computes all-pairs shortest
+        # paths in place. Since the assignment maximizes welfare, every cycle
+        # weight is >= 0 and shortest paths are well-defined; the row minimum of
+        # the distance matrix is a feasible potential for the difference
+        # constraints p_i - p_j <= w(i→j).
+        for k in range(n):
+            np.minimum(W, W[:, k, None] + W[k, None, :], out=W)
+
+        # W[i, i] == 0 covers the empty path
+        potentials = W.min(axis=1).tolist()
+
+        # Convert potentials into preliminary prices (they are envy-free)
+        # Payment_i = potential_i
+        prices = potentials[:]
+
+        # -----------------------------
+        # Adjust prices so they sum to the rent
+        # -----------------------------
+        total_price = sum(prices)
+        shift = (total_price - rent) / n
+        prices = [p - shift for p in prices]
 
     # -----------------------------
     # Print result
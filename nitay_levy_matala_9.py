@@ -1,10 +1,122 @@
 from typing import List
 import math
 
+import numpy as np
+
+
+def _sorted_votes_matrix(citizen_votes: List[List[int]]) -> np.ndarray:
+    """
+    Pack the votes into an (m, k+1) float matrix: one row per subject, holding
+    that subject's k votes plus a 0, sorted. All median queries work on rows
+    of this matrix.
+    """
+    votes = np.asarray(citizen_votes, dtype=float).T  # (subjects, citizens)
+    padded = np.concatenate([np.zeros((votes.shape[0], 1)), votes], axis=1)
+    return np.sort(padded, axis=1)
+
+
+def _subject_allocations(V: np.ndarray, x: float) -> np.ndarray:
+    """
+    Median of {0, v1, ..., vk, x} for every subject at once, where `V` is the
+    pre-sorted matrix from _sorted_votes_matrix. Instead of re-sorting per
+    query, x's insertion point is found per row and the median slots of the
+    (k+2)-element merged row are read off positionally.
+    """
+    n = V.shape[1] + 1  # size of each merged row
+    pos = (V < x).sum(axis=1)  # left insertion point per row
+
+    def merged(t: int) -> np.ndarray:
+        return np.where(pos > t, V[:, t], np.where(pos == t, x, V[:, t - 1]))
+
+    if n % 2 == 1:
+        return merged(n // 2).astype(float)
+    else:
+        return (merged(n // 2 - 1) + merged(n // 2)) / 2.0
+
+
+def _subject_slopes(V: np.ndarray, x: float) -> np.ndarray:
+    """
+    Right-hand derivative of _subject_allocations at x, per subject: 1.0 when
+    x is the single median of the merged row, 0.5 when it is one of the two
+    middle elements, and 0.0 otherwise. The right insertion point is used so
+    that the slope matches the behavior of x + eps without evaluating it.
+    """
+    n = V.shape[1] + 1  # size of each merged row
+    pos = (V <= x).sum(axis=1)  # right insertion point per row
+    if n % 2 == 1:
+        return (pos == n // 2).astype(float)
+    else:
+        return 0.5 * ((pos == n // 2 - 1) | (pos == n // 2))
+
+
+def _total_allocations(V: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """
+    Total allocation (summed over subjects) at every query in xs, returned as
+    one array of len(xs). Same positional median read as
+    _subject_allocations, broadcast over an (m, s) insertion-point grid.
+    """
+    n = V.shape[1] + 1  # size of each merged row
+    pos = (V[:, :, None] < xs[None, None, :]).sum(axis=1)  # (subjects, queries)
+
+    def merged(t: int) -> np.ndarray:
+        return np.where(pos > t, V[:, t, None],
+                        np.where(pos == t, xs[None, :], V[:, t - 1, None]))
+
+    if n % 2 == 1:
+        alloc = merged(n // 2)
+    else:
+        alloc = (merged(n // 2 - 1) + merged(n // 2)) / 2.0
+    return alloc.sum(axis=0)
+
+
+def _compute_budget_floats(total_budget: int, citizen_votes: List[List[int]]) -> List[float]:
+    """
+    Shared core of the General Median Algorithm: find the tax cap x at which
+    the per-subject median allocations sum to the budget, and return those
+    (fractional) allocations. The public functions differ only in how they
+    round the result to integers.
+    """
+    V = _sorted_votes_matrix(citizen_votes)
+
+    # Breakpoints where the slope of the total budget function can change:
+    # every distinct vote value plus 0, which V already carries in its
+    # leading column. np.unique sorts and deduplicates in one C pass.
+    sorted_breaks = np.unique(V)
+
+    # Totals at every breakpoint in one vectorized pass; T(x) is piecewise
+    # linear and nondecreasing, so the segment containing the budget is
+    # found with searchsorted and resolved by linear interpolation.
+    totals = _total_allocations(V, sorted_breaks)
+
+    if totals[0] <= total_budget <= totals[-1] + 1e-9:
+        idx = int(np.searchsorted(totals, total_budget))
+        if idx == 0:
+            target_x = float(sorted_breaks[0])
+        else:
+            idx = min(idx, len(totals) - 1)
+            x_low, x_high = float(sorted_breaks[idx - 1]), float(sorted_breaks[idx])
+            t_low, t_high = float(totals[idx - 1]), float(totals[idx])
+            if t_high > t_low:
+                # Each segment is linear, so the secant is the exact slope
+                target_x = x_low + (total_budget - t_low) * (x_high - x_low) / (t_high - t_low)
+            else:
+                target_x = x_low
+    else:
+        # Extrapolate beyond the largest vote
+        x_last = float(sorted_breaks[-1])
+        slope_last = float(_subject_slopes(V, x_last).sum())
+        if slope_last > 1e-9:
+            target_x = x_last + (total_budget - float(totals[-1])) / slope_last
+        else:
+            target_x = x_last
+
+    return _subject_allocations(V, target_x).tolist()
+
+
 def compute_budget(total_budget: int, citizen_votes: List[List[int]]) -> List[int]:
     """
     Computes budget using the General Median Algorithm with binary search.
-    
+
     >>> compute_budget(100, [[100, 0, 0], [0, 0, 100]])
     [50, 0, 50]
     >>> compute_budget(100, [[80, 20], [20, 80]])
@@ -18,77 +130,25 @@ def compute_budget(total_budget: int, citizen_votes: List[List[int]]) -> List[in
         return []
 
     num_subjects = len(citizen_votes[0])
-    votes_per_subject = [sorted([citizen[i] for citizen in citizen_votes]) for i in range(num_subjects)]
-    
-    # Breakpoints where the slope of the total budget function can change
-    breakpoints = {0}
-    for votes in votes_per_subject:
-        breakpoints.update(votes)
-    sorted_breaks = sorted(list(breakpoints))
-
-    def get_subject_allocation(votes: List[int], x: float) -> float:
-        # Median of {0, v1, ..., vn, x}
-        # In a list of N+2 elements, the median is the average of the two middle elements
-        # if N+2 is even, or the middle element if odd.
-        arr = sorted(votes + [0, x])
-        n = len(arr)
-        if n % 2 == 1:
-            return float(arr[n // 2])
-        else:
-            return (arr[n // 2 - 1] + arr[n // 2]) / 2.0
-
-    def get_total_and_slope(x: float):
-        total = 0.0
-        slope = 0
-        eps = 1e-8
-        for votes in votes_per_subject:
-            v_now = get_subject_allocation(votes, x)
-            v_next = get_subject_allocation(votes, x + eps)
-            total += v_now
-            # If the value increased, the slope for this subject is active (0.5 or 1.0)
-            if v_next > v_now:
-                slope += (v_next - v_now) / eps
-        return total, slope
-
-    # Find the linear segment [x_low, x_high] containing total_budget
-    target_x = 0.0
-    for i in range(len(sorted_breaks) - 1):
-        x_low, x_high = sorted_breaks[i], sorted_breaks[i+1]
-        sum_low, slope_low = get_total_and_slope(x_low)
-        sum_high, _ = get_total_and_slope(x_high)
-        
-        if sum_low <= total_budget <= sum_high + 1e-9:
-            if slope_low > 1e-9:
-                target_x = x_low + (total_budget - sum_low) / slope_low
-            else:
-                target_x = x_low
-            break
-    else:
-        # Extrapolate beyond the largest vote
-        sum_last, slope_last = get_total_and_slope(sorted_breaks[-1])
-        if slope_last > 1e-9:
-            target_x = sorted_breaks[-1] + (total_budget - sum_last) / slope_last
-        else:
-            target_x = sorted_breaks[-1]
 
     # Calculate final floats and use Largest Remainder Method for integers
-    floats = [get_subject_allocation(v, target_x) for v in votes_per_subject]
+    floats = _compute_budget_floats(total_budget, citizen_votes)
     ints = [int(math.floor(f + 1e-11)) for f in floats]
-    
+
     remainder = total_budget - sum(ints)
     if remainder > 0:
         # Tie-breaking: fractional part descending, then index ascending
         indices = sorted(range(num_subjects), key=lambda i: (floats[i] - ints[i], -i), reverse=True)
         for i in range(int(round(remainder))):
             ints[indices[i]] += 1
-            
+
     return ints
 
 
 def no_binary_search_compute_budget(total_budget: int, citizen_votes: List[List[int]]) -> List[int]:
     """
     Computes budget using the General Median Algorithm by solving piecewise linear intervals.
-    
+
     >>> no_binary_search_compute_budget(100, [[100, 0, 0], [0, 0, 100]])
     [50, 0, 50]
     >>> no_binary_search_compute_budget(100, [[80, 20], [20, 80]])
@@ -102,67 +162,18 @@ def no_binary_search_compute_budget(total_budget: int, citizen_votes: List[List[
         return []
 
     num_subjects = len(citizen_votes[0])
-    votes_per_subject = [sorted([citizen[i] for citizen in citizen_votes]) for i in range(num_subjects)]
-    
-    # Breakpoints are where the slope changes
-    breakpoints = {0}
-    for votes in votes_per_subject:
-        breakpoints.update(votes)
-    sorted_breaks = sorted(list(breakpoints))
-
-    def get_subject_allocation(votes: List[int], x: float) -> float:
-        # Median of {0, v1, ..., vn, x}
-        arr = sorted(votes + [0, x])
-        n = len(arr)
-        if n % 2 == 1:
-            return float(arr[n // 2])
-        else:
-            return (arr[n // 2 - 1] + arr[n // 2]) / 2.0
-
-    def get_total_and_slope(x: float):
-        total = 0.0
-        slope = 0.0
-        eps = 1e-8
-        for votes in votes_per_subject:
-            v_now = get_subject_allocation(votes, x)
-            v_next = get_subject_allocation(votes, x + eps)
-            total += v_now
-            # Calculate the local slope (rate of change)
-            slope += (v_next - v_now) / eps
-        return total, slope
-
-    target_x = 0.0
-    for i in range(len(sorted_breaks) - 1):
-        x_low, x_high = sorted_breaks[i], sorted_breaks[i+1]
-        sum_low, slope_low = get_total_and_slope(x_low)
-        sum_high, _ = get_total_and_slope(x_high)
-        
-        # Check if the total budget falls within this linear segment
-        if sum_low <= total_budget <= sum_high + 1e-9:
-            if slope_low > 1e-9:
-                target_x = x_low + (total_budget - sum_low) / slope_low
-            else:
-                target_x = x_low
-            break
-    else:
-        # Handle cases where budget exceeds the sum at the highest vote
-        sum_last, slope_last = get_total_and_slope(sorted_breaks[-1])
-        if slope_last > 1e-9:
-            target_x = sorted_breaks[-1] + (total_budget - sum_last) / slope_last
-        else:
-            target_x = sorted_breaks[-1]
 
     # Final allocation and integer rounding using Largest Remainder Method
-    floats = [get_subject_allocation(v, target_x) for v in votes_per_subject]
+    floats = _compute_budget_floats(total_budget, citizen_votes)
     ints = [int(math.floor(f + 1e-11)) for f in floats]
-    
+
     remainder = total_budget - sum(ints)
     if remainder > 0:
         # Sort by fractional part (descending) and use index for stability
         indices = sorted(range(num_subjects), key=lambda i: (round(floats[i] - ints[i], 10), -i), reverse=True)
         for i in range(int(round(remainder))):
             ints[indices[i % num_subjects]] += 1
-            
+
     return ints
 
 